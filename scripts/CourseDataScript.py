@@ -2,37 +2,37 @@ import requests
 from bs4 import BeautifulSoup
 import json
 from datetime import datetime
-from supabase import create_client
 import re
 import os
-from dotenv import load_dotenv
-import sys
+from supabase_client import create_supabase_client
 
-# Load environment variables from .env.local
-env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env.local')
-if not load_dotenv(env_path):
-    print("Error: Could not load .env.local file")
-    sys.exit(1)
+supabase = create_supabase_client()
 
-# Get Supabase credentials from environment variables
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # Using service role key for database operations
-
-if not SUPABASE_URL or not SUPABASE_KEY:
-    print("Error: Required environment variables NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY not found")
-    sys.exit(1)
-
-# Initialize Supabase client
-try:
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-except Exception as e:
-    print(f"Error initializing Supabase client: {str(e)}")
-    sys.exit(1)
+# Directory where each scrape is saved so later runs can be diffed against it
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), 'snapshots')
 
 def extract_program_code(url):
     return url.split('/')[-1].replace('.html', '').upper()
 
+def save_snapshot(courses, failed_programs):
+    """Write the scraped course rows to a timestamped JSON snapshot."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    taken_at = datetime.now()
+    path = os.path.join(SNAPSHOT_DIR, f"courses_{taken_at.strftime('%Y%m%d_%H%M%S')}.json")
+    
+    with open(path, 'w') as f:
+        json.dump({'taken_at': taken_at.isoformat(), 'failed_programs': failed_programs, 'courses': courses}, f, indent=2)
+    
+    return path
+
 def get_and_insert_course_info(program_code):
+    """
+    Scrape and insert the courses for a program.
+
+    Returns the scraped rows and whether the program was scraped completely.
+    Rows are kept even if their insert fails, since the snapshot records what
+    was scraped rather than what reached the database.
+    """
     url = "https://brocku.ca/guides-and-timetables/wp-content/plugins/brocku-plugin-course-tables/ajax.php"
     data = {
         "action": "get_programcourses",
@@ -45,12 +45,19 @@ def get_and_insert_course_info(program_code):
     
     try:
         response = requests.post(url, data=data)
+        response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # Find all course rows
         course_rows = soup.find_all('tr', class_='course-row')
         
+        if not course_rows:
+            print(f"No course rows found for {program_code}")
+            return [], False
+        
+        scraped_courses = []
         inserted_count = 0
+        complete = True
         for row in course_rows:
             # Only process main course entries (lectures)
             if row.get('data-main_flag') == '1':
@@ -70,19 +77,31 @@ def get_and_insert_course_info(program_code):
                         'start_date': start_date,
                         'end_date': end_date
                     }
-                    
+                except Exception as e:
+                    print(f"Error processing course in {program_code}: {str(e)}")
+                    complete = False
+                    continue
+                
+                # The courses table has no section or program columns, so these only go in the snapshot
+                snapshot_row = {**course_data, 'id': None, 'section': row.get('data-section'), 'program': program_code}
+                scraped_courses.append(snapshot_row)
+                
+                try:
                     # Insert data into Supabase
                     response = supabase.table('courses').insert(course_data).execute()
+                    # Record the row id so the diff can pick this scrape's rows out of the live table
+                    snapshot_row['id'] = response.data[0]['id']
                     inserted_count += 1
-                    
                 except Exception as e:
-                    print(f"Error processing course in {program_code}: {str(e)}")
+                    print(f"Error inserting course in {program_code}: {str(e)}")
                     continue
         
         print(f"Successfully inserted {inserted_count} courses for {program_code}")
+        return scraped_courses, complete
         
     except Exception as e:
         print(f"Error fetching data for {program_code}: {str(e)}")
+        return [], False
 
 def main():
     # List of URLs
@@ -187,16 +206,29 @@ def main():
     
     total_programs = len(urls)
     processed_programs = 0
+    scraped_courses = []
+    failed_programs = []
     
     print(f"Starting to process {total_programs} programs...")
     
     for url in urls:
         program_code = extract_program_code(url)
         print(f"\nProcessing program {processed_programs + 1}/{total_programs}: {program_code}")
-        get_and_insert_course_info(program_code)
+        program_courses, complete = get_and_insert_course_info(program_code)
+        scraped_courses.extend(program_courses)
+        if not complete:
+            failed_programs.append(program_code)
         processed_programs += 1
         
     print(f"\nFinished processing all {total_programs} programs")
+    
+    try:
+        snapshot_path = save_snapshot(scraped_courses, failed_programs)
+        print(f"Saved snapshot of {len(scraped_courses)} courses to {snapshot_path}")
+        if failed_programs:
+            print(f"Warning: snapshot is incomplete for {', '.join(failed_programs)}")
+    except Exception as e:
+        print(f"Error saving snapshot: {str(e)}")
 
 def get_course_info():
     url = "https://brocku.ca/guides-and-timetables/wp-content/plugins/brocku-plugin-course-tables/ajax.php"
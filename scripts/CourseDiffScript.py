@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+# Columns that are compared between snapshots, grouped by the change category they report under
+CHANGE_FIELDS = {
+    'time_changed': ['class_time'],
+    'days_changed': ['course_days'],
+    'instructor_changed': ['instructor'],
+    'dates_changed': ['start_date', 'end_date'],
+}
+
+# Supabase returns at most this many rows per request, so the live table is read in pages
+LIVE_PAGE_SIZE = 1000
+
+# Directory CourseDataScript saves its snapshots to
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), 'snapshots')
+
+def load_snapshot(path):
+    """Load a snapshot written by CourseDataScript."""
+    with open(path) as f:
+        snapshot = json.load(f)
+    snapshot.setdefault('failed_programs', [])
+    return snapshot
+
+def latest_snapshot_path():
+    """Return the path of the most recent snapshot saved by CourseDataScript, if any."""
+    paths = sorted(glob.glob(os.path.join(SNAPSHOT_DIR, 'courses_*.json')))
+    return paths[-1] if paths else None
+
+def fetch_live_courses(scrape_snapshot):
+    """
+    Read the rows of the given scrape from the courses table.
+
+    CourseDataScript only ever appends, so the table holds every scrape that
+    was ever loaded. Only the rows whose ids the scrape's snapshot recorded
+    are kept, and they are tagged with the section and program from it.
+    """
+    from supabase_client import create_supabase_client
+
+    scraped_by_id = {course['id']: course for course in scrape_snapshot['courses'] if course.get('id') is not None}
+    if not scraped_by_id:
+        raise ValueError("the latest snapshot has no course ids, rerun CourseDataScript to record them")
+
+    supabase = create_supabase_client()
+
+    courses = []
+    start = 0
+    while True:
+        result = supabase.table('courses').select('*').order('id').range(start, start + LIVE_PAGE_SIZE - 1).execute()
+        for course in result.data:
+            scraped = scraped_by_id.get(course['id'])
+            if scraped is not None:
+                courses.append({**course, 'section': scraped.get('section'), 'program': scraped.get('program')})
+        if len(result.data) < LIVE_PAGE_SIZE:
+            return {'taken_at': scrape_snapshot['taken_at'], 'failed_programs': scrape_snapshot['failed_programs'], 'courses': courses}
+        start += LIVE_PAGE_SIZE
+
+def section_key(course):
+    """Build the part of a section's key that is present on both snapshot and live rows."""
+    return (course.get('course_code'), course.get('course_duration'), course.get('class_type'))
+
+def program_of(course):
+    """Return the program a row was scraped under, falling back to its course code prefix for untagged rows."""
+    return course.get('program') or (course.get('course_code') or '').split(' ')[0]
+
+def compared_values(course):
+    return tuple(course.get(field) for fields in CHANGE_FIELDS.values() for field in fields)
+
+def group_sections(courses):
+    groups = {}
+    for course in courses:
+        groups.setdefault(section_key(course), []).append(course)
+    return groups
+
+def pair_sections(old_rows, new_rows):
+    """
+    Pair up the old and new rows that share a section key.
+
+    Rows are hash joined on their section number. Rows without one (e.g. from
+    snapshots taken before sections were recorded) are then hash joined on
+    their compared values, so unchanged sections pair up without a search.
+    Only the few rows still left are paired with their closest match, by
+    position on ties. Returns the pairs and the unpaired old and new rows.
+    """
+    pairs = []
+    old_by_section = {}
+    old_unsectioned = []
+    for old in old_rows:
+        if old.get('section') is None:
+            old_unsectioned.append(old)
+        else:
+            old_by_section.setdefault(old['section'], []).append(old)
+
+    new_unpaired = []
+    for new in new_rows:
+        candidates = old_by_section.get(new.get('section'))
+        if new.get('section') is not None and candidates:
+            pairs.append((candidates.pop(0), new))
+        else:
+            new_unpaired.append(new)
+    old_unpaired = old_unsectioned + [old for rows in old_by_section.values() for old in rows]
+
+    # Two numbered sections that didn't match are a real add and remove, not a change
+    def can_pair(old, new):
+        return old.get('section') is None or new.get('section') is None
+
+    old_by_values = {}
+    for old in old_unpaired:
+        old_by_values.setdefault(compared_values(old), []).append(old)
+
+    paired_old = set()
+    still_unpaired = []
+    for new in new_unpaired:
+        bucket = old_by_values.get(compared_values(new), [])
+        match = next((old for old in bucket if can_pair(old, new)), None)
+        if match is None:
+            still_unpaired.append(new)
+        else:
+            bucket.remove(match)
+            paired_old.add(id(match))
+            pairs.append((match, new))
+    new_unpaired = still_unpaired
+    old_unpaired = [old for old in old_unpaired if id(old) not in paired_old]
+
+    candidates = []
+    for new_index, new in enumerate(new_unpaired):
+        for old_index, old in enumerate(old_unpaired):
+            if can_pair(old, new):
+                shared = sum(a == b for a, b in zip(compared_values(old), compared_values(new)))
+                candidates.append((-shared, abs(new_index - old_index), new_index, old_index))
+
+    paired_new = set()
+    paired_old = set()
+    for _, _, new_index, old_index in sorted(candidates):
+        if new_index not in paired_new and old_index not in paired_old:
+            paired_new.add(new_index)
+            paired_old.add(old_index)
+            pairs.append((old_unpaired[old_index], new_unpaired[new_index]))
+
+    old_unpaired = [old for index, old in enumerate(old_unpaired) if index not in paired_old]
+    new_unpaired = [new for index, new in enumerate(new_unpaired) if index not in paired_new]
+    return pairs, old_unpaired, new_unpaired
+
+def describe_change(old, new):
+    """Identify the section a change entry refers to."""
+    return {'id': new.get('id'),
+            'course_code': new.get('course_code'),
+            'course_duration': new.get('course_duration'),
+            'class_type': new.get('class_type'),
+            'section': new.get('section', old.get('section')),
+            'course_days': new.get('course_days'),
+            'class_time': new.get('class_time')}
+
+def diff_courses(old_snapshot, new_snapshot):
+    """
+    Compare two snapshots and categorize every difference.
+
+    Both snapshots are grouped by section key and the groups are hash joined,
+    then the rows within each group are paired by pair_sections; whatever is
+    left unmatched was added or removed. Programs that failed to scrape in
+    either snapshot are left out of the added and removed lists, since their
+    missing rows say nothing about the catalogue. So are the course codes seen
+    under those programs, which catches courses cross-listed on their pages.
+    """
+    report = {'added': [], 'removed': []}
+    for category in CHANGE_FIELDS:
+        report[category] = []
+
+    skipped_programs = set(old_snapshot['failed_programs']) | set(new_snapshot['failed_programs'])
+    report['skipped_programs'] = sorted(skipped_programs)
+    skipped_codes = {course.get('course_code') for snapshot in (old_snapshot, new_snapshot)
+                     for course in snapshot['courses'] if program_of(course) in skipped_programs}
+
+    def is_reported(course):
+        return program_of(course) not in skipped_programs and course.get('course_code') not in skipped_codes
+
+    old_groups = group_sections(old_snapshot['courses'])
+    new_groups = group_sections(new_snapshot['courses'])
+    for key, new_rows in new_groups.items():
+        pairs, removed, added = pair_sections(old_groups.pop(key, []), new_rows)
+        report['added'].extend(course for course in added if is_reported(course))
+        report['removed'].extend(course for course in removed if is_reported(course))
+
+        for old, new in pairs:
+            for category, fields in CHANGE_FIELDS.items():
+                changes = {field: {'old': old.get(field), 'new': new.get(field)}
+                           for field in fields if old.get(field) != new.get(field)}
+                if changes:
+                    report[category].append({**describe_change(old, new), 'changes': changes})
+
+    for old_rows in old_groups.values():
+        report['removed'].extend(course for course in old_rows if is_reported(course))
+    return report
+
+def describe_section(course):
+    description = f"{course.get('course_code')} D{course.get('course_duration')} {course.get('class_type')}"
+    if course.get('section') is not None:
+        description += f" SEC {course.get('section')}"
+    return description
+
+def print_report(report):
+    """Print a human-readable summary of a diff report."""
+    print("\n📋 Course Catalogue Changes:")
+    print("-" * 70)
+    for category in ['added', 'removed'] + list(CHANGE_FIELDS):
+        print(f"{category.replace('_', ' ').upper():<20} | {len(report[category])}")
+    print("-" * 70)
+
+    if report['skipped_programs']:
+        print(f"⚠️  Incomplete scrape, added/removed sections not reported for: {', '.join(report['skipped_programs'])}")
+        print("    Courses those programs cross-list are only excluded if a snapshot recorded them under the program.")
+
+    for course in report['added']:
+        print(f"+ {describe_section(course)} ({course.get('course_days')} {course.get('class_time')}, {course.get('instructor')})")
+    for course in report['removed']:
+        print(f"- {describe_section(course)} ({course.get('course_days')} {course.get('class_time')}, {course.get('instructor')})")
+    for category in CHANGE_FIELDS:
+        for entry in report[category]:
+            details = ', '.join(f"{field}: {change['old']} -> {change['new']}" for field, change in entry['changes'].items())
+            print(f"~ {describe_section(entry)} ({entry.get('course_days')} {entry.get('class_time')}) {details}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two course snapshots, or a snapshot against the live courses table.")
+    parser.add_argument('old', help="Path to the older snapshot")
+    parser.add_argument('new', nargs='?',
+                        help="Path to the newer snapshot (defaults to the rows of the latest scrape in the live courses table)")
+    parser.add_argument('--output', help="Also write the full report to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        old_snapshot = load_snapshot(args.old)
+        if args.new:
+            new_snapshot = load_snapshot(args.new)
+        else:
+            scrape_path = latest_snapshot_path()
+            if scrape_path is None:
+                raise ValueError(f"no snapshots found in {SNAPSHOT_DIR}, run CourseDataScript first")
+            new_snapshot = fetch_live_courses(load_snapshot(scrape_path))
+    except Exception as e:
+        print(f"Error loading courses: {str(e)}")
+        sys.exit(1)
+
+    report = diff_courses(old_snapshot, new_snapshot)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved report to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import os
+import sys
+from dotenv import load_dotenv
+from supabase import create_client
+
+def create_supabase_client():
+    """Create a Supabase client from the credentials in .env.local, exiting if they are missing."""
+    # Load environment variables from .env.local
+    env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env.local')
+    if not load_dotenv(env_path):
+        print("Error: Could not load .env.local file")
+        sys.exit(1)
+
+    # Get Supabase credentials from environment variables
+    supabase_url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
+    supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # Using service role key for database operations
+
+    if not supabase_url or not supabase_key:
+        print("Error: Required environment variables NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY not found")
+        sys.exit(1)
+
+    # Initialize Supabase client
+    try:
+        return create_client(supabase_url, supabase_key)
+    except Exception as e:
+        print(f"Error initializing Supabase client: {str(e)}")
+        sys.exit(1)